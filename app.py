@@ -14,28 +14,52 @@ Sprint 2 Features:
 
 import sys
 import subprocess
-import platform
+import threading
+from array import array
 from pathlib import Path
 from typing import Optional, List
 from dataclasses import dataclass
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFileDialog, QTableWidget, QTableWidgetItem,
-    QProgressBar, QMessageBox, QHeaderView, QAbstractItemView,
+    QLabel, QPushButton, QFileDialog, QTableView, QStyledItemDelegate,
+    QStyle, QStyleOptionProgressBar, QStyleOptionViewItem,
+    QMessageBox, QHeaderView, QAbstractItemView,
     QGroupBox, QSizePolicy, QTextEdit, QMenu, QCheckBox, QSplitter
 )
-from PySide6.QtCore import Qt, QThread, Signal, QMimeData, QUrl
-from PySide6.QtGui import QPixmap, QDragEnterEvent, QDropEvent, QAction, QColor
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, Signal, QSignalBlocker, QMimeData, QUrl,
+    QAbstractTableModel, QModelIndex
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QImageReader, QDragEnterEvent, QDropEvent, QAction, QColor, QBrush
 
-from converter import convert_audio_to_video, ConversionResult
+from converter import (
+    convert_audio_to_video, select_video_encoder,
+    ConversionResult, SOFTWARE_VIDEO_ENCODER
+)
 from utils import (
-    get_default_output_folder, ensure_output_folder, get_unique_output_path,
-    is_supported_audio_file, is_supported_image_file
+    get_default_output_folder, ensure_output_folder, get_unique_output_path, list_output_names,
+    is_supported_audio_file, is_supported_image_file, iter_audio_files,
+    filter_audio_paths
 )
 from config import load_config, save_config, AppConfig
 
 
+# Commands to open files / folders with the default application (resolved once)
+if sys.platform == "win32":
+    OPEN_FILE_COMMAND = ["start", ""]  # Shell builtin, needs shell=True
+    OPEN_FOLDER_COMMAND = ["explorer"]
+elif sys.platform == "darwin":
+    OPEN_FILE_COMMAND = ["open"]
+    OPEN_FOLDER_COMMAND = ["open"]
+else:
+    OPEN_FILE_COMMAND = ["xdg-open"]
+    OPEN_FOLDER_COMMAND = ["xdg-open"]
+
+# How often the UI polls conversion progress (~30 Hz)
+PROGRESS_REFRESH_INTERVAL_MS = 33
+
+
 # Status constants (Portuguese)
 STATUS_QUEUED = "Na fila"
 STATUS_CONVERTING = "Convertendo"
@@ -54,70 +78,325 @@ class AudioItem:
     error_message: Optional[str] = None
 
 
-class ConversionWorker(QThread):
-    """Worker thread for running conversions without freezing the UI."""
-    
-    progress_updated = Signal(int, float)  # row, progress (0.0-1.0)
-    status_updated = Signal(int, str)  # row, status
-    conversion_completed = Signal(int, bool, str, str)  # row, success, output_path, error_message
-    log_message = Signal(str)  # log message
-    all_completed = Signal()
+class ConversionTask(QRunnable):
+    """Converts a single audio item on a QThreadPool thread."""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.items: List[tuple] = []
-        self.cancelled = False
-        self.current_row = -1
-    
-    def set_items(self, items: List[tuple]):
-        """Set the items to convert."""
-        self.items = items
-        self.cancelled = False
-    
-    def cancel(self):
-        """Request cancellation of the current conversion."""
-        self.cancelled = True
+    def __init__(self, worker: "ConversionWorker", row: int, audio_path: Path,
+                 cover_path: Path, output_path: Path):
+        super().__init__()
+        self.worker = worker
+        self.row = row
+        self.audio_path = audio_path
+        self.cover_path = cover_path
+        self.output_path = output_path
     
     def run(self):
-        """Run the conversion process for all items."""
-        for row, audio_path, cover_path, output_path in self.items:
-            if self.cancelled:
-                self.status_updated.emit(row, STATUS_CANCELLED)
-                continue
+        """Run the conversion for this item and report back through the worker."""
+        worker = self.worker
+        row = self.row
+        audio_path = self.audio_path
+        output_path = self.output_path
+        
+        # Tasks dropped by a cancellation are already reported as cancelled
+        if not worker.claim(row):
+            return
+        
+        try:
+            if worker.cancel_event.is_set():
+                worker.status_updated.emit(row, STATUS_CANCELLED)
+                return
             
-            self.current_row = row
-            self.status_updated.emit(row, STATUS_CONVERTING)
-            self.log_message.emit(f"[INÍCIO] Convertendo: {audio_path.name}")
+            video_encoder = worker.resolve_video_encoder()
             
-            def progress_callback(progress: float):
-                self.progress_updated.emit(row, progress)
+            worker.status_updated.emit(row, STATUS_CONVERTING)
+            worker.log_message.emit(f"[INÍCIO] Convertendo: {audio_path.name}")
             
-            def cancel_check() -> bool:
-                return self.cancelled
+            def progress_callback(progress: float):
+                worker.set_progress(row, progress)
             
             result = convert_audio_to_video(
                 audio_path=audio_path,
-                cover_image_path=cover_path,
+                cover_image_path=self.cover_path,
                 output_path=output_path,
                 progress_callback=progress_callback,
-                cancel_check=cancel_check
+                cancel_check=worker.cancel_event.is_set,
+                video_encoder=video_encoder
             )
             
-            if self.cancelled:
-                self.status_updated.emit(row, STATUS_CANCELLED)
-                self.conversion_completed.emit(row, False, "", "Conversão cancelada")
-                self.log_message.emit(f"[CANCELADO] {audio_path.name}")
+            if worker.cancel_event.is_set():
+                worker.status_updated.emit(row, STATUS_CANCELLED)
+                worker.conversion_completed.emit(row, False, "", "Conversão cancelada")
+                worker.log_message.emit(f"[CANCELADO] {audio_path.name}")
             elif result.success:
-                self.status_updated.emit(row, STATUS_COMPLETED)
-                self.conversion_completed.emit(row, True, str(result.output_path), "")
-                self.log_message.emit(f"[CONCLUÍDO] {audio_path.name} → {output_path.name}")
+                worker.status_updated.emit(row, STATUS_COMPLETED)
+                worker.conversion_completed.emit(row, True, str(result.output_path), "")
+                worker.log_message.emit(f"[CONCLUÍDO] {audio_path.name} → {output_path.name}")
             else:
-                self.status_updated.emit(row, STATUS_ERROR)
-                self.conversion_completed.emit(row, False, "", result.error_message or "Erro desconhecido")
-                self.log_message.emit(f"[ERRO] {audio_path.name}: {result.error_message}")
+                worker.status_updated.emit(row, STATUS_ERROR)
+                worker.conversion_completed.emit(row, False, "", result.error_message or "Erro desconhecido")
+                worker.log_message.emit(f"[ERRO] {audio_path.name}: {result.error_message}")
+        finally:
+            worker.task_done()
+
+
+class ConversionWorker(QObject):
+    """
+    Runs conversions concurrently on a QThreadPool without freezing the UI.
+    One ConversionTask is queued per item; this object holds the signals
+    (QRunnable cannot inherit QObject) and tracks when all tasks are done.
+    
+    Progress is not signalled: tasks write it into a shared array that the
+    UI polls on a timer (see progress()), so fast progress reports from
+    several conversions never pile up in the UI event queue. Signals are
+    only used for status changes, which are rare.
+
+    Threads are enough here: each conversion already runs in its own ffmpeg
+    process, and the pool threads only block on pipe reads, which release
+    the GIL. A process pool would add pickling and IPC for the progress and
+    cancel callbacks without freeing any extra CPU.
+    """
+    
+    status_updated = Signal(int, str)  # row, status
+    conversion_completed = Signal(int, bool, str, str)  # row, success, output_path, error_message
+    log_message = Signal(str)  # log message
+    all_completed = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending_rows = set()
+        self._remaining = 0
+        self._progress = array("f")
+        self._setup_lock = threading.Lock()
+        self.use_hardware = False
+        self.video_encoder: Optional[str] = None
+    
+    def start(self, items: List[tuple], use_hardware: bool = False):
+        """Queue one conversion task per (row, audio, cover, output) item."""
+        self.cancel_event.clear()
+        self.use_hardware = use_hardware
+        self.video_encoder = None
+        with self._lock:
+            self._pending_rows = {row for row, _, _, _ in items}
+            self._remaining = len(items)
+            self._progress = array("f", [0.0]) * (max(self._pending_rows, default=-1) + 1)
+        
+        self.pool.setMaxThreadCount(max(1, min(QThread.idealThreadCount(), len(items))))
+        for row, audio_path, cover_path, output_path in items:
+            self.pool.start(ConversionTask(self, row, audio_path, cover_path, output_path))
+    
+    def resolve_video_encoder(self) -> str:
+        """
+        Returns the video encoder for the current batch. The first task to
+        call it runs the hardware encoder detection (a test encode, cached
+        for the session) on its pool thread, so the UI never waits for it;
+        the other tasks wait for that result.
+        """
+        with self._setup_lock:
+            if self.video_encoder is None:
+                self.video_encoder = select_video_encoder(self.use_hardware)
+                if self.use_hardware:
+                    if self.video_encoder == SOFTWARE_VIDEO_ENCODER:
+                        self.log_message.emit("[AVISO] Aceleração por hardware indisponível; usando codificação por software.")
+                    else:
+                        self.log_message.emit(f"[INFO] Usando codificador de hardware: {self.video_encoder}")
+            return self.video_encoder
+    
+    def set_progress(self, row: int, progress: float):
+        """
+        Record the progress (0.0-1.0) of a row. Called from pool threads.
+        Lock-free: storing one array item is atomic under the GIL, so a
+        conversion never waits on the UI (or on other conversions) here.
+        """
+        self._progress[row] = progress
+    
+    def progress(self, row: int) -> float:
+        """Returns the last recorded progress (0.0-1.0) of a row."""
+        values = self._progress
+        return values[row] if row < len(values) else 0.0
+    
+    def claim(self, row: int) -> bool:
+        """Mark a task as started. Returns False if it was dropped by cancel()."""
+        with self._lock:
+            if row not in self._pending_rows:
+                return False
+            self._pending_rows.discard(row)
+            return True
+    
+    def cancel(self):
+        """Request cancellation of running conversions and drop queued ones."""
+        self.cancel_event.set()
+        with self._lock:
+            self.pool.clear()
+            dropped = sorted(self._pending_rows)
+            self._pending_rows.clear()
+        
+        for row in dropped:
+            self.status_updated.emit(row, STATUS_CANCELLED)
+            self.task_done()
+    
+    def task_done(self):
+        """Called once per item; emits all_completed after the last one."""
+        with self._lock:
+            self._remaining -= 1
+            finished = self._remaining == 0
+        
+        if finished:
+            self.log_message.emit("[FIM] Todas as conversões finalizadas.")
+            self.all_completed.emit()
+    
+    def is_running(self) -> bool:
+        """Returns True while any item is still queued or converting."""
+        with self._lock:
+            return self._remaining > 0
+    
+    def wait(self, msecs: int = -1) -> bool:
+        """Wait for running tasks to finish. Returns True if all finished."""
+        return self.pool.waitForDone(msecs)
+
+
+class AudioQueueModel(QAbstractTableModel):
+    """
+    Table model over the conversion queue (the list of AudioItem).
+    The view reads everything from the items, so updates are a single
+    dataChanged signal instead of per-row widget changes.
+    """
+    
+    COLUMN_NAME = 0
+    COLUMN_STATUS = 1
+    COLUMN_PROGRESS = 2
+    COLUMN_OUTPUT = 3
+    HEADERS = ["Arquivo", "Status", "Progresso", "Arquivo de saída"]
+    
+    def __init__(self, items: List[AudioItem], parent=None):
+        super().__init__(parent)
+        self.items = items
         
-        self.log_message.emit("[FIM] Todas as conversões finalizadas.")
-        self.all_completed.emit()
+        # Status column colors, built once
+        self._status_brushes = {
+            STATUS_COMPLETED: QBrush(Qt.darkGreen),
+            STATUS_ERROR: QBrush(Qt.red),
+            STATUS_CANCELLED: QBrush(Qt.darkYellow),
+            STATUS_CONVERTING: QBrush(Qt.blue),
+        }
+        self._default_brush = QBrush(Qt.black)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.items)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.items):
+            return None
+        
+        item = self.items[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == self.COLUMN_NAME:
+                return item.file_path.name
+            if column == self.COLUMN_STATUS:
+                return item.status
+            if column == self.COLUMN_PROGRESS:
+                return f"{int(item.progress * 100)}%"
+            if column == self.COLUMN_OUTPUT:
+                if item.output_path:
+                    return item.output_path.name
+                if item.status == STATUS_ERROR and item.error_message:
+                    return f"Erro: {item.error_message[:50]}..."
+                return ""
+        elif role == Qt.UserRole and column == self.COLUMN_PROGRESS:
+            return item.progress
+        elif role == Qt.ToolTipRole and column == self.COLUMN_NAME:
+            return str(item.file_path)
+        elif role == Qt.ForegroundRole and column == self.COLUMN_STATUS:
+            return self._status_brushes.get(item.status, self._default_brush)
+        
+        return None
+    
+    def append_items(self, items: List[AudioItem]):
+        """Append several items with a single insertion notification."""
+        first = len(self.items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self.items.extend(items)
+        self.endInsertRows()
+    
+    def remove_row(self, row: int):
+        """Remove the item at the given row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.items[row]
+        self.endRemoveRows()
+    
+    def remove_rows(self, rows: List[int]):
+        """
+        Remove several rows at once.
+        Consecutive rows are removed as one range, so selecting a block of
+        items triggers a single removal notification instead of one per row.
+        """
+        rows = sorted(set(rows), reverse=True)
+        if len(rows) == len(self.items):
+            self.clear()
+            return
+        
+        index = 0
+        while index < len(rows):
+            last = first = rows[index]
+            index += 1
+            while index < len(rows) and rows[index] == first - 1:
+                first = rows[index]
+                index += 1
+            
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.items[first:last + 1]
+            self.endRemoveRows()
+    
+    def clear(self):
+        """Remove all items."""
+        self.beginResetModel()
+        self.items.clear()
+        self.endResetModel()
+    
+    def refresh_row(self, row: int, column: Optional[int] = None):
+        """Notify the view that a row (or a single cell of it) changed."""
+        first = column if column is not None else 0
+        last = column if column is not None else len(self.HEADERS) - 1
+        self.dataChanged.emit(self.index(row, first), self.index(row, last))
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints the progress column as a progress bar, without a widget per row."""
+    
+    def paint(self, painter, option, index):
+        view_option = QStyleOptionViewItem(option)
+        self.initStyleOption(view_option, index)
+        view_option.text = ""
+        
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        
+        # Row background (selection / alternating colors)
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, view_option, painter, widget)
+        
+        value = int((index.data(Qt.UserRole) or 0.0) * 100)
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 2, -2, -2)
+        bar.state = QStyle.State_Enabled | QStyle.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = value
+        bar.text = f"{value}%"
+        bar.textVisible = True
+        bar.textAlignment = Qt.AlignCenter
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter, widget)
 
 
 class MainWindow(QMainWindow):
@@ -132,9 +411,28 @@ class MainWindow(QMainWindow):
         self.cover_image_path: Optional[Path] = None
         self.output_folder: Path = self._get_initial_output_folder()
         self.audio_items: List[AudioItem] = []
-        self.worker: Optional[ConversionWorker] = None
+        self.model = AudioQueueModel(self.audio_items)
         self.is_converting = False
         
+        # One worker (and thread pool) for the whole session, reused per batch
+        self.worker = ConversionWorker(self)
+        self.worker.status_updated.connect(self.on_status_updated)
+        self.worker.conversion_completed.connect(self.on_conversion_completed)
+        self.worker.log_message.connect(self.add_log)
+        self.worker.all_completed.connect(self.on_all_completed)
+        
+        # Coalesce config writes triggered by UI changes into one per second
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(1000)
+        self._config_save_timer.timeout.connect(lambda: save_config(self.config))
+        
+        # Poll conversion progress instead of receiving one signal per update
+        self._converting_rows: List[int] = []
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_REFRESH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self.refresh_progress)
+        
         self.init_ui()
         self.setAcceptDrops(True)
         self._load_last_cover_image()
@@ -229,9 +527,9 @@ class MainWindow(QMainWindow):
         audio_layout.addLayout(audio_buttons_layout)
         
         # Audio table with context menu
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Arquivo", "Status", "Progresso", "Arquivo de saída"])
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(AudioQueueModel.COLUMN_PROGRESS, ProgressDelegate(self.table))
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Fixed)
@@ -239,7 +537,7 @@ class MainWindow(QMainWindow):
         self.table.setColumnWidth(2, 150)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setAlternatingRowColors(True)
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
         audio_layout.addWidget(self.table)
@@ -267,6 +565,16 @@ class MainWindow(QMainWindow):
         self.chk_open_on_finish.stateChanged.connect(self._on_open_on_finish_changed)
         output_layout.addWidget(self.chk_open_on_finish)
         
+        self.chk_hardware_encoding = QCheckBox("Usar aceleração por hardware")
+        self.chk_hardware_encoding.setToolTip(
+            "Usa o codificador de vídeo da placa gráfica, se disponível.\n"
+            "A imagem de capa é codificada uma única vez por lote, então isso só\n"
+            "faz diferença quando a codificação completa de cada quadro é necessária."
+        )
+        self.chk_hardware_encoding.setChecked(self.config.use_hardware_encoding)
+        self.chk_hardware_encoding.toggled.connect(self._on_hardware_encoding_toggled)
+        output_layout.addWidget(self.chk_hardware_encoding)
+        
         main_layout.addWidget(output_group)
         
         # Log panel (collapsible)
@@ -360,6 +668,10 @@ class MainWindow(QMainWindow):
         # Status bar
         self.statusBar().showMessage("Pronto. Arraste arquivos ou selecione uma imagem de capa.")
     
+    def schedule_config_save(self):
+        """Save the config shortly, merging rapid successive changes into one write."""
+        self._config_save_timer.start()
+    
     def _on_log_panel_toggled(self, checked: bool):
         """Handle log panel toggle."""
         self.log_text.setVisible(checked)
@@ -374,12 +686,17 @@ class MainWindow(QMainWindow):
                         widget.setVisible(checked)
         
         self.config.logs_panel_visible = checked
-        save_config(self.config)
+        self.schedule_config_save()
     
     def _on_open_on_finish_changed(self, state: int):
         """Handle open on finish checkbox change."""
         self.config.open_folder_on_finish = state == Qt.Checked
-        save_config(self.config)
+        self.schedule_config_save()
+    
+    def _on_hardware_encoding_toggled(self, checked: bool):
+        """Handle hardware encoding checkbox change."""
+        self.config.use_hardware_encoding = checked
+        self.schedule_config_save()
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter - accept if has URLs."""
@@ -400,27 +717,25 @@ class MainWindow(QMainWindow):
         urls = event.mimeData().urls()
         
         images_added = 0
-        audios_added = 0
+        audio_paths = []
         
         for url in urls:
             path = Path(url.toLocalFile())
             
             if path.is_dir():
                 # Scan folder recursively for audio files
-                for file_path in path.rglob("*"):
-                    if file_path.is_file() and is_supported_audio_file(file_path):
-                        self.add_audio_item(file_path)
-                        audios_added += 1
+                audio_paths.extend(iter_audio_files(path))
             elif path.is_file():
                 if is_supported_image_file(path):
                     self.set_cover_image(path)
                     images_added += 1
                 elif is_supported_audio_file(path):
-                    self.add_audio_item(path)
-                    audios_added += 1
+                    audio_paths.append(path)
                 else:
                     self.add_log(f"[AVISO] Arquivo não suportado: {path.name}")
         
+        audios_added = self.add_audio_items(audio_paths)
+        
         if images_added > 0 or audios_added > 0:
             msg_parts = []
             if images_added > 0:
@@ -471,12 +786,7 @@ class MainWindow(QMainWindow):
     def open_file(self, path: Path):
         """Open a file with the default application."""
         try:
-            if platform.system() == "Windows":
-                subprocess.run(["start", "", str(path)], shell=True, check=False)
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", str(path)], check=False)
-            else:
-                subprocess.run(["xdg-open", str(path)], check=False)
+            subprocess.run([*OPEN_FILE_COMMAND, str(path)], shell=sys.platform == "win32", check=False)
         except Exception as e:
             QMessageBox.warning(self, "Erro", f"Não foi possível abrir o arquivo: {e}")
     
@@ -488,13 +798,7 @@ class MainWindow(QMainWindow):
             item.progress = 0.0
             item.output_path = None
             item.error_message = None
-            
-            self.table.item(row, 1).setText(STATUS_QUEUED)
-            self.table.item(row, 1).setForeground(Qt.black)
-            self.table.item(row, 3).setText("")
-            progress_bar = self.table.cellWidget(row, 2)
-            if progress_bar:
-                progress_bar.setValue(0)
+            self.model.refresh_row(row)
             
             self.statusBar().showMessage(f"'{item.file_path.name}' marcado para tentar novamente.")
             self.update_buttons_state()
@@ -502,8 +806,7 @@ class MainWindow(QMainWindow):
     def remove_row(self, row: int):
         """Remove a specific row from the table."""
         if 0 <= row < len(self.audio_items):
-            self.table.removeRow(row)
-            del self.audio_items[row]
+            self.model.remove_row(row)
             self.update_buttons_state()
     
     def add_log(self, message: str):
@@ -536,12 +839,12 @@ class MainWindow(QMainWindow):
     
     def cancel_conversion(self):
         """Cancel the current conversion."""
-        if self.worker:
+        if self.worker.is_running():
             reply = QMessageBox.question(
                 self,
                 "Cancelar conversão",
                 "Deseja cancelar a conversão em andamento?\n\n"
-                "O arquivo atual será interrompido e marcado como 'Cancelado'.",
+                "Os arquivos em andamento serão interrompidos e marcados como 'Cancelado'.",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
@@ -585,20 +888,40 @@ class MainWindow(QMainWindow):
         self.cover_image_path = path
         self.cover_label.setText(path.name)
         
-        # Update preview
-        pixmap = QPixmap(str(path))
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                self.cover_preview.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+        # Update preview (scaled previews are cached by path, mtime and size)
+        stat = path.stat()
+        preview_size = self.cover_preview.size()
+        cache_key = (
+            f"cover:{path}:{stat.st_mtime_ns}:{stat.st_size}:"
+            f"{preview_size.width()}x{preview_size.height()}"
+        )
+        scaled = QPixmapCache.find(cache_key)
+        if scaled is None:
+            # Let the decoder downsample while reading (e.g. JPEG DCT scaling)
+            # instead of decoding the full-resolution image just for a thumbnail
+            reader = QImageReader(str(path))
+            reader.setAutoTransform(True)
+            image_size = reader.size()
+            decode_size = preview_size * 2
+            if image_size.isValid() and (
+                image_size.width() > decode_size.width() or image_size.height() > decode_size.height()
+            ):
+                reader.setScaledSize(image_size.scaled(decode_size, Qt.KeepAspectRatio))
+            pixmap = QPixmap.fromImage(reader.read())
+            if not pixmap.isNull():
+                scaled = pixmap.scaled(
+                    preview_size,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+                QPixmapCache.insert(cache_key, scaled)
+        if scaled is not None:
             self.cover_preview.setPixmap(scaled)
         
         # Save to config
         if save_to_config:
             self.config.last_cover_image = str(path)
-            save_config(self.config)
+            self.schedule_config_save()
         
         self.update_start_button_state()
         self.statusBar().showMessage(f"Imagem de capa selecionada: {path.name}")
@@ -617,55 +940,32 @@ class MainWindow(QMainWindow):
         )
         
         if files:
-            added_count = 0
-            for file_path in files:
-                path = Path(file_path)
-                if is_supported_audio_file(path):
-                    self.add_audio_item(path)
-                    added_count += 1
+            # "Todos os arquivos" is also offered, so the filter alone is not enough
+            paths = filter_audio_paths(map(Path, files))
+            added_count = self.add_audio_items(paths)
             
             if added_count > 0:
                 self.statusBar().showMessage(f"{added_count} arquivo(s) de áudio adicionado(s).")
             
             self.update_buttons_state()
     
-    def add_audio_item(self, path: Path):
-        """Add an audio item to the table."""
-        # Check if already added
-        for item in self.audio_items:
-            if item.file_path == path:
-                return  # Skip duplicates
-        
-        item = AudioItem(file_path=path)
-        self.audio_items.append(item)
-        
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # File name
-        name_item = QTableWidgetItem(path.name)
-        name_item.setToolTip(str(path))
-        name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-        self.table.setItem(row, 0, name_item)
-        
-        # Status
-        status_item = QTableWidgetItem(STATUS_QUEUED)
-        status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-        self.table.setItem(row, 1, status_item)
-        
-        # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setMinimum(0)
-        progress_bar.setMaximum(100)
-        progress_bar.setValue(0)
-        progress_bar.setTextVisible(True)
-        progress_bar.setFormat("%p%")
-        self.table.setCellWidget(row, 2, progress_bar)
-        
-        # Output file (empty initially)
-        output_item = QTableWidgetItem("")
-        output_item.setFlags(output_item.flags() & ~Qt.ItemIsEditable)
-        self.table.setItem(row, 3, output_item)
+    def add_audio_items(self, paths: List[Path]) -> int:
+        """
+        Add several audio items to the table in one batch.
+        Files already in the list are skipped. Returns the number added.
+        """
+        known_paths = {item.file_path for item in self.audio_items}
+        new_items = []
+        for path in paths:
+            if path not in known_paths:
+                known_paths.add(path)
+                new_items.append(AudioItem(file_path=path))
+        
+        if new_items:
+            # Callers refresh the buttons once afterwards
+            with QSignalBlocker(self.table.selectionModel()):
+                self.model.append_items(new_items)
+        return len(new_items)
     
     def remove_selected(self):
         """Remove selected items from the table."""
@@ -677,11 +977,9 @@ class MainWindow(QMainWindow):
             )
             return
         
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()), reverse=True)
-        
-        for row in selected_rows:
-            self.table.removeRow(row)
-            del self.audio_items[row]
+        selected_rows = [index.row() for index in self.table.selectionModel().selectedRows()]
+        with QSignalBlocker(self.table.selectionModel()):
+            self.model.remove_rows(selected_rows)
         
         self.update_buttons_state()
         self.statusBar().showMessage(f"{len(selected_rows)} item(ns) removido(s).")
@@ -696,20 +994,31 @@ class MainWindow(QMainWindow):
             )
             return
         
-        reply = QMessageBox.question(
-            self,
+        # Window-modal but asynchronous: the event loop keeps running
+        box = QMessageBox(
+            QMessageBox.Question,
             "Confirmar",
             "Deseja remover todos os itens da lista?",
             QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            self
+        )
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(
+            lambda _: self._on_clear_list_confirmed(box.clickedButton() == box.button(QMessageBox.Yes))
         )
+        box.open()
+    
+    def _on_clear_list_confirmed(self, confirmed: bool):
+        """Clear the list after the user answered the confirmation box."""
+        if not confirmed or self.is_converting:
+            return
         
-        if reply == QMessageBox.Yes:
-            self.table.setRowCount(0)
-            self.audio_items.clear()
-            self.update_buttons_state()
-            self.update_global_progress()
-            self.statusBar().showMessage("Lista limpa.")
+        with QSignalBlocker(self.table.selectionModel()):
+            self.model.clear()
+        self.update_buttons_state()
+        self.update_global_progress()
+        self.statusBar().showMessage("Lista limpa.")
     
     def select_output_folder(self):
         """Open dialog to select output folder."""
@@ -725,31 +1034,26 @@ class MainWindow(QMainWindow):
             
             # Save to config
             self.config.last_output_folder = str(self.output_folder)
-            save_config(self.config)
+            self.schedule_config_save()
             
             self.statusBar().showMessage(f"Pasta de saída alterada para: {self.output_folder}")
     
     def open_output_folder(self):
         """Open the output folder in file explorer."""
         folder = self.output_folder
-        if not folder.exists():
-            try:
-                folder.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Erro",
-                    f"Não foi possível criar a pasta: {e}"
-                )
-                return
+        try:
+            # exist_ok makes a separate exists() check unnecessary
+            folder.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            QMessageBox.warning(
+                self,
+                "Erro",
+                f"Não foi possível criar a pasta: {e}"
+            )
+            return
         
         try:
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", str(folder)], check=False)
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", str(folder)], check=False)
-            else:
-                subprocess.run(["xdg-open", str(folder)], check=False)
+            subprocess.run([*OPEN_FOLDER_COMMAND, str(folder)], check=False)
         except Exception as e:
             QMessageBox.warning(
                 self,
@@ -759,13 +1063,13 @@ class MainWindow(QMainWindow):
     
     def on_selection_changed(self):
         """Handle table selection change."""
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         self.btn_remove_selected.setEnabled(has_selection and not self.is_converting)
     
     def update_buttons_state(self):
         """Update the enabled state of buttons."""
         has_items = len(self.audio_items) > 0
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         
         self.btn_remove_selected.setEnabled(has_selection and not self.is_converting)
         self.btn_clear_list.setEnabled(has_items and not self.is_converting)
@@ -823,29 +1127,48 @@ class MainWindow(QMainWindow):
             )
             return
         
+        cover_path = self.cover_image_path
+        
         # Prepare conversion items
+        rows = [
+            row for row, item in enumerate(self.audio_items)
+            if item.status in (STATUS_QUEUED, STATUS_ERROR, STATUS_CANCELLED)
+        ]
+        
+        # List the output folder once for the whole batch and resolve names
+        # in queue order; each name is added to the set, so two items with
+        # the same stem never get the same path
+        existing_names = list_output_names(self.output_folder)
+        if existing_names is None:
+            QMessageBox.critical(
+                self,
+                "Erro",
+                f"Não foi possível ler a pasta de saída: {self.output_folder}"
+            )
+            return
+        
+        output_paths = [
+            get_unique_output_path(
+                self.output_folder,
+                self.audio_items[row].file_path.stem,
+                existing=existing_names
+            )
+            for row in rows
+        ]
+        
         items_to_convert = []
-        for row, item in enumerate(self.audio_items):
-            if item.status in (STATUS_QUEUED, STATUS_ERROR, STATUS_CANCELLED):
-                output_path = get_unique_output_path(
-                    self.output_folder,
-                    item.file_path.stem
-                )
-                items_to_convert.append((row, item.file_path, self.cover_image_path, output_path))
-                
-                # Reset item state
-                item.status = STATUS_QUEUED
-                item.progress = 0.0
-                item.output_path = None
-                item.error_message = None
-                
-                # Update table
-                self.table.item(row, 1).setText(STATUS_QUEUED)
-                self.table.item(row, 1).setForeground(Qt.black)
-                self.table.item(row, 3).setText("")
-                progress_bar = self.table.cellWidget(row, 2)
-                if progress_bar:
-                    progress_bar.setValue(0)
+        for row, output_path in zip(rows, output_paths):
+            item = self.audio_items[row]
+            items_to_convert.append((row, item.file_path, cover_path, output_path))
+            
+            # Reset item state
+            item.status = STATUS_QUEUED
+            item.progress = 0.0
+            item.output_path = None
+            item.error_message = None
+            
+            # Update table
+            self.model.refresh_row(row)
         
         if not items_to_convert:
             QMessageBox.information(
@@ -861,48 +1184,34 @@ class MainWindow(QMainWindow):
         self.btn_add_audio.setEnabled(False)
         self.btn_select_cover.setEnabled(False)
         self.btn_select_output.setEnabled(False)
+        self.chk_hardware_encoding.setEnabled(False)
         self.btn_cancel.setEnabled(True)
         self.update_global_progress()
         
         self.add_log(f"[INÍCIO] Iniciando conversão de {len(items_to_convert)} arquivo(s)...")
         self.statusBar().showMessage("Iniciando conversão...")
         
-        # Create and start worker
-        self.worker = ConversionWorker(self)
-        self.worker.set_items(items_to_convert)
-        self.worker.progress_updated.connect(self.on_progress_updated)
-        self.worker.status_updated.connect(self.on_status_updated)
-        self.worker.conversion_completed.connect(self.on_conversion_completed)
-        self.worker.log_message.connect(self.add_log)
-        self.worker.all_completed.connect(self.on_all_completed)
-        self.worker.start()
+        # Start worker (hardware encoder detection runs on the pool)
+        self.worker.start(items_to_convert, self.config.use_hardware_encoding)
+        
+        self._converting_rows = [row for row, _, _, _ in items_to_convert]
+        self._progress_timer.start()
     
-    def on_progress_updated(self, row: int, progress: float):
-        """Handle progress update from worker."""
-        if 0 <= row < len(self.audio_items):
-            self.audio_items[row].progress = progress
-            progress_bar = self.table.cellWidget(row, 2)
-            if progress_bar:
-                progress_bar.setValue(int(progress * 100))
+    def refresh_progress(self):
+        """Copy progress written by the conversion tasks into the table (timer slot)."""
+        for row in self._converting_rows:
+            if row < len(self.audio_items):
+                progress = self.worker.progress(row)
+                item = self.audio_items[row]
+                if progress != item.progress:
+                    item.progress = progress
+                    self.model.refresh_row(row, AudioQueueModel.COLUMN_PROGRESS)
     
     def on_status_updated(self, row: int, status: str):
         """Handle status update from worker."""
         if 0 <= row < len(self.audio_items):
             self.audio_items[row].status = status
-            self.table.item(row, 1).setText(status)
-            
-            # Update status color
-            status_item = self.table.item(row, 1)
-            if status == STATUS_COMPLETED:
-                status_item.setForeground(Qt.darkGreen)
-            elif status == STATUS_ERROR:
-                status_item.setForeground(Qt.red)
-            elif status == STATUS_CANCELLED:
-                status_item.setForeground(Qt.darkYellow)
-            elif status == STATUS_CONVERTING:
-                status_item.setForeground(Qt.blue)
-            else:
-                status_item.setForeground(Qt.black)
+            self.model.refresh_row(row, AudioQueueModel.COLUMN_STATUS)
             
             self.update_global_progress()
     
@@ -913,20 +1222,24 @@ class MainWindow(QMainWindow):
             
             if success:
                 item.output_path = Path(output_path)
-                self.table.item(row, 3).setText(Path(output_path).name)
                 self.statusBar().showMessage(f"Concluído: {item.file_path.name}")
             else:
                 item.error_message = error_message
-                if error_message and "cancelad" not in error_message.lower():
-                    self.table.item(row, 3).setText(f"Erro: {error_message[:50]}...")
+            
+            self.model.refresh_row(row, AudioQueueModel.COLUMN_OUTPUT)
     
     def on_all_completed(self):
         """Handle completion of all conversions."""
+        self._progress_timer.stop()
+        self.refresh_progress()
+        self._converting_rows = []
+        
         self.is_converting = False
         self.update_buttons_state()
         self.btn_add_audio.setEnabled(True)
         self.btn_select_cover.setEnabled(True)
         self.btn_select_output.setEnabled(True)
+        self.chk_hardware_encoding.setEnabled(True)
         self.btn_cancel.setEnabled(False)
         
         # Count results
@@ -948,8 +1261,8 @@ class MainWindow(QMainWindow):
             self.open_output_folder()
         
         if errors > 0:
-            QMessageBox.warning(
-                self,
+            self.show_notification(
+                QMessageBox.Warning,
                 "Conversão concluída com erros",
                 f"A conversão foi concluída.\n\n"
                 f"• {completed} arquivo(s) convertido(s) com sucesso\n"
@@ -957,22 +1270,30 @@ class MainWindow(QMainWindow):
                 f"Verifique a coluna 'Arquivo de saída' para mais detalhes."
             )
         elif completed > 0 and not self.config.open_folder_on_finish:
-            QMessageBox.information(
-                self,
+            self.show_notification(
+                QMessageBox.Information,
                 "Conversão concluída",
                 f"Todos os {completed} arquivo(s) foram convertidos com sucesso!\n\n"
                 f"Os vídeos foram salvos em:\n{self.output_folder}"
             )
     
+    def show_notification(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a non-modal message box that does not block the event loop."""
+        box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+        box.setWindowModality(Qt.NonModal)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.show()
+    
     def closeEvent(self, event):
         """Handle window close event."""
         # Save window size
         self.config.window_width = self.width()
         self.config.window_height = self.height()
+        self._config_save_timer.stop()
         save_config(self.config)
         
         # Cancel any running conversion
-        if self.worker and self.worker.isRunning():
+        if self.worker.is_running():
             self.worker.cancel()
             self.worker.wait(3000)
         
@@ -988,6 +1309,9 @@ def main():
     # Set application style
     app.setStyle("Fusion")
     
+    # Room for cached cover previews (in KB)
+    QPixmapCache.setCacheLimit(65536)
+    
     window = MainWindow()
     window.show()
     
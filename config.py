@@ -4,19 +4,29 @@ Handles saving and loading user preferences (JSON).
 """
 
 import json
+import os
+import functools
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 
 from utils import get_app_dir, get_default_output_folder
 
+try:
+    import orjson  # Optional: faster (de)serialization, bytes in/out
+except ImportError:
+    orjson = None
 
+
+@functools.lru_cache(maxsize=None)
 def get_config_path() -> Path:
-    """Returns the path to the config file."""
+    """
+    Returns the path to the config file.
+    Cached so the directory lookup and mkdir happen once per process.
+    """
     import sys
     if sys.platform == "win32":
         # Windows: use AppData/Local
-        import os
         app_data = Path(os.environ.get("LOCALAPPDATA", ""))
         if app_data.exists():
             config_dir = app_data / "Audio2Video"
@@ -42,46 +52,77 @@ class AppConfig:
     window_width: int = 900
     window_height: int = 700
     logs_panel_visible: bool = False
+    use_hardware_encoding: bool = False
     
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (fields are flat, so a shallow copy is enough)."""
+        return dict(self.__dict__)
     
     @classmethod
     def from_dict(cls, data: dict) -> "AppConfig":
-        """Create from dictionary."""
-        return cls(
-            last_output_folder=data.get("last_output_folder"),
-            last_cover_image=data.get("last_cover_image"),
-            open_folder_on_finish=data.get("open_folder_on_finish", False),
-            window_width=data.get("window_width", 900),
-            window_height=data.get("window_height", 700),
-            logs_panel_visible=data.get("logs_panel_visible", False),
-        )
+        """
+        Create from dictionary.
+        Missing keys use the field defaults; unknown keys are ignored.
+        """
+        return cls(**{
+            field.name: data.get(field.name, getattr(cls, field.name))
+            for field in fields(cls)
+        })
+
+
+# Parsed config, shared by every load_config() call after the first
+_cached_config: Optional[AppConfig] = None
 
 
 def load_config() -> AppConfig:
-    """Load configuration from file."""
+    """
+    Load configuration from file.
+    The file is only read once; later calls return the same instance.
+    """
+    global _cached_config
+    if _cached_config is not None:
+        return _cached_config
+    
     config_path = get_config_path()
+    config = AppConfig()
     
     if config_path.exists():
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return AppConfig.from_dict(data)
-        except (json.JSONDecodeError, IOError):
+            raw = config_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+            config = AppConfig.from_dict(data)
+        except (ValueError, IOError):
+            # ValueError covers JSONDecodeError (json and orjson) and bad UTF-8
             pass
     
-    return AppConfig()
+    _cached_config = config
+    return config
 
 
 def save_config(config: AppConfig) -> bool:
-    """Save configuration to file. Returns True on success."""
+    """
+    Save configuration to file. Returns True on success.
+    Writes to a temporary file first, fsyncs it and then replaces the
+    config file, so a crash mid-write never leaves a truncated config.
+    """
+    global _cached_config
+    _cached_config = config
+    
     config_path = get_config_path()
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    
+    if orjson:
+        payload = orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(config.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
     
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            # Make sure the data is on disk before the rename makes it visible
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
         return True
     except IOError:
         return False
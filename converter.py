@@ -5,11 +5,71 @@ Handles audio-to-video conversion using a cover image.
 
 import subprocess
 import re
+import os
+import sys
+import queue
+import selectors
+import time
+import hashlib
+import tempfile
+import functools
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, Callable, Tuple
+from typing import Optional, Callable, Iterator, Tuple
 from dataclasses import dataclass
 
-from utils import get_ffmpeg_path, get_ffprobe_path, safe_path_string
+from utils import (
+    get_ffmpeg_path, get_ffprobe_path, get_cache_dir, get_letterbox_filter, safe_path_string
+)
+
+
+# Keeps ffmpeg/ffprobe from opening a console window on Windows (0 elsewhere)
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Default output video resolution (width, height)
+DEFAULT_RESOLUTION = (1280, 720)
+
+# Software MPEG-2 encoder (always available)
+SOFTWARE_VIDEO_ENCODER = "mpeg2video"
+
+# Hardware MPEG-2 encoders in order of preference, with the pixel format
+# each one expects. Only encoders that need no extra device setup are listed.
+HARDWARE_VIDEO_ENCODERS = {
+    "mpeg2_qsv": "nv12",  # Intel Quick Sync
+}
+
+# Keyframe interval for the still-image video, in seconds
+# (ffmpeg's MPEG-2 encoder caps the GOP at 600 frames)
+STILL_IMAGE_GOP_SECONDS = 10
+
+# Cached still-image segments kept on disk (about 5 MB each); the oldest
+# are deleted when a new one is created
+STILL_SEGMENT_CACHE_SIZE = 8
+
+# Temporary segment files left behind by an interrupted run are deleted
+# after this many seconds
+_STALE_TMP_SECONDS = 3600
+
+# Number of trailing ffmpeg stderr lines kept for error messages
+STDERR_TAIL_LINES = 50
+
+# Serializes creation of the cached still-image video segments
+_segment_lock = threading.Lock()
+
+# Output folders already created by this process (skips repeated mkdir calls)
+_created_dirs = set()
+
+# ffmpeg input description lines, e.g. "Input #1, mp3, from 'a.mp3':"
+# followed by "  Duration: 00:03:12.34, start: ..."
+# Matched on raw bytes so ffmpeg's output never has to be decoded
+_INPUT_RE = re.compile(rb"Input #(\d+),")
+_DURATION_RE = re.compile(rb"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})")
+
+# Progress pipe reads: block size, and how long to wait for data before
+# giving the caller a chance to check for cancellation
+_PROGRESS_READ_SIZE = 4096
+_PROGRESS_POLL_SECONDS = 0.25
 
 
 @dataclass
@@ -20,9 +80,46 @@ class ConversionResult:
     error_message: Optional[str] = None
 
 
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Returns os.stat() of the path, or None if it cannot be read."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _parse_duration(data: bytes) -> Optional[float]:
+    """
+    Parses the "Duration: HH:MM:SS.cc" field of ffmpeg output, in seconds.
+    The field is fixed-width, so it is read at fixed offsets after a find();
+    the regex is only used when that layout does not match.
+    """
+    start = data.find(b"Duration: ")
+    if start == -1:
+        return None
+    
+    field = data[start + 10:start + 21]
+    if (
+        len(field) == 11
+        and field[2] == field[5] == ord(":")
+        and field[8] == ord(".")
+        and (field[0:2] + field[3:5] + field[6:8] + field[9:11]).isdigit()
+    ):
+        return int(field[0:2]) * 3600 + int(field[3:5]) * 60 + int(field[6:8]) + int(field[9:11]) / 100
+    
+    match = _DURATION_RE.search(data, start)
+    if match:
+        hours, minutes, seconds, centiseconds = (int(group) for group in match.groups())
+        return hours * 3600 + minutes * 60 + seconds + centiseconds / 100
+    
+    return None
+
+
 def get_audio_duration(audio_path: Path) -> Optional[float]:
     """
     Gets the duration of an audio file in seconds using ffprobe.
+    Kept as standalone API: conversions read the duration from ffmpeg's
+    own output instead of calling this.
     Returns None if duration cannot be determined.
     """
     ffprobe_path = get_ffprobe_path()
@@ -44,7 +141,7 @@ def get_audio_duration(audio_path: Path) -> Optional[float]:
             cmd,
             capture_output=True,
             text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            creationflags=_CREATION_FLAGS
         )
         
         if result.returncode == 0 and result.stdout.strip():
@@ -74,37 +171,297 @@ def get_audio_duration_ffmpeg(audio_path: Path) -> Optional[float]:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            creationflags=_CREATION_FLAGS
         )
         
         # Parse duration from stderr
-        duration_pattern = r"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})"
-        match = re.search(duration_pattern, result.stderr)
+        return _parse_duration(result.stderr)
+    except subprocess.SubprocessError:
+        pass
+    
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def find_hardware_video_encoder() -> Optional[str]:
+    """
+    Returns the first hardware MPEG-2 encoder that works on this machine,
+    or None if there is none.
+    An encoder being listed by ffmpeg does not mean the GPU/driver is
+    present, so each candidate is checked with a tiny test encode.
+    The result is cached for the lifetime of the process.
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    
+    if not ffmpeg_path.exists():
+        return None
+    
+    try:
+        result = subprocess.run(
+            [safe_path_string(ffmpeg_path), "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            creationflags=_CREATION_FLAGS
+        )
+    except subprocess.SubprocessError:
+        return None
+    
+    # Encoder lines look like: " V....D mpeg2_qsv  MPEG-2 video (Intel Quick Sync Video acceleration)"
+    listed = {line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1}
+    
+    for encoder, pixel_format in HARDWARE_VIDEO_ENCODERS.items():
+        if encoder not in listed:
+            continue
+        
+        cmd = [
+            safe_path_string(ffmpeg_path),
+            "-hide_banner",
+            "-v", "error",
+            "-f", "lavfi",
+            "-i", "color=c=black:s=320x240:r=30:d=0.2",
+            "-vf", f"format={pixel_format}",
+            "-c:v", encoder,
+            "-f", "null", "-"
+        ]
+        try:
+            test = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=15,
+                creationflags=_CREATION_FLAGS
+            )
+            if test.returncode == 0:
+                return encoder
+        except subprocess.SubprocessError:
+            continue
+    
+    return None
+
+
+def select_video_encoder(use_hardware: bool) -> str:
+    """
+    Returns the video encoder to use: a working hardware encoder when
+    requested and available, otherwise the software mpeg2video encoder.
+    """
+    if use_hardware:
+        return find_hardware_video_encoder() or SOFTWARE_VIDEO_ENCODER
+    return SOFTWARE_VIDEO_ENCODER
+
+
+def _evict_still_segments(cache_dir: Path):
+    """
+    Deletes the oldest cached still segments beyond STILL_SEGMENT_CACHE_SIZE,
+    and temporary segment files abandoned by an interrupted run.
+    """
+    segments = []
+    stale_before = time.time() - _STALE_TMP_SECONDS
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".nut"):
+                    continue
+                mtime = entry.stat().st_mtime
+                if entry.name.startswith("still_"):
+                    segments.append((mtime, entry.path))
+                elif entry.name.startswith("tmp") and mtime < stale_before:
+                    os.remove(entry.path)
+    except OSError:
+        return
+    
+    segments.sort(reverse=True)
+    for _, path in segments[STILL_SEGMENT_CACHE_SIZE:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # e.g. still open by a conversion on Windows
+
+
+def prepare_still_segment(
+    cover_image_path: Path,
+    resolution: Tuple[int, int] = DEFAULT_RESOLUTION,
+    fps: int = 30,
+    video_bitrate: str = "4000k",
+    video_encoder: str = SOFTWARE_VIDEO_ENCODER,
+    cover_stat: Optional[os.stat_result] = None
+) -> Optional[Path]:
+    """
+    Encodes the cover image once as a short MPEG-2 segment (a single closed
+    GOP) that can be looped with stream copy for the whole audio, instead
+    of encoding the same picture again for every frame of every file.
+    The result is cached on disk, keyed by the image and encoding settings;
+    only the STILL_SEGMENT_CACHE_SIZE most recent segments are kept.
+    cover_stat can be passed when the caller has already stat'ed the image.
+    
+    Returns the segment path, or None if it could not be created.
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    
+    if not ffmpeg_path.exists():
+        return None
+    
+    try:
+        stat = cover_stat or cover_image_path.stat()
+        width, height = resolution
+        key = (
+            f"{os.fspath(cover_image_path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+            f"{width}x{height}|{fps}|{video_bitrate}|{video_encoder}"
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        
+        # NUT keeps per-frame durations, so the loop points get exact timestamps
+        cache_dir = get_cache_dir()
+        segment_path = cache_dir / f"still_{digest}.nut"
         
-        if match:
-            hours = int(match.group(1))
-            minutes = int(match.group(2))
-            seconds = int(match.group(3))
-            centiseconds = int(match.group(4))
+        with _segment_lock:
+            if segment_path.exists():
+                return segment_path
             
-            return hours * 3600 + minutes * 60 + seconds + centiseconds / 100
-    except subprocess.SubprocessError:
+            gop_size = fps * STILL_IMAGE_GOP_SECONDS
+            # A unique temporary name: other app instances may be creating
+            # the same segment (the lock only covers this process)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".nut")
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            cmd = [
+                safe_path_string(ffmpeg_path),
+                "-y",
+                "-v", "error",
+                "-loop", "1",
+                "-framerate", "1",
+                "-i", safe_path_string(cover_image_path),
+                "-t", str(STILL_IMAGE_GOP_SECONDS),
+                "-vf", get_letterbox_filter(resolution, HARDWARE_VIDEO_ENCODERS.get(video_encoder, "yuv420p")),
+                "-r", str(fps),
+                "-c:v", video_encoder,
+                "-b:v", video_bitrate,
+                # One closed GOP without B-frames, so every loop starts cleanly
+                "-g", str(gop_size),
+                "-bf", "0",
+                "-flags", "+cgop",
+            ]
+            if video_encoder == SOFTWARE_VIDEO_ENCODER:
+                # Closed GOPs require scene change detection to be off
+                cmd += ["-sc_threshold", "1000000000"]
+            cmd += ["-f", "nut", safe_path_string(tmp_path)]
+            
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    creationflags=_CREATION_FLAGS
+                )
+                
+                if result.returncode == 0 and tmp_path.stat().st_size > 0:
+                    os.replace(tmp_path, segment_path)
+                    _evict_still_segments(cache_dir)
+                    return segment_path
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+    except (subprocess.SubprocessError, OSError):
         pass
     
     return None
 
 
+class _StderrReader(threading.Thread):
+    """
+    Drains ffmpeg's stderr on a background thread.
+    Keeps the last STDERR_TAIL_LINES lines for error messages and picks up
+    the duration ffmpeg prints for one of its inputs, so no separate probe
+    process is needed.
+    """
+    
+    def __init__(self, stream, input_index: int):
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.input_index = input_index
+        self.lines = deque(maxlen=STDERR_TAIL_LINES)
+        self.duration: Optional[float] = None
+        self._current_input: Optional[int] = None
+    
+    def run(self):
+        for line in self.stream:
+            self.lines.append(line)
+            if self.duration is None:
+                self._parse_duration(line)
+    
+    def _parse_duration(self, line: bytes):
+        input_match = _INPUT_RE.match(line)
+        if input_match:
+            self._current_input = int(input_match.group(1))
+            return
+        
+        if self._current_input == self.input_index:
+            self.duration = _parse_duration(line)
+    
+    @property
+    def output(self) -> str:
+        """The most recent stderr lines."""
+        return b"".join(self.lines).decode("utf-8", errors="replace")
+
+
+def _read_progress_chunks(stream) -> Iterator[bytes]:
+    """
+    Reads ffmpeg's progress pipe in blocks instead of line by line.
+    
+    Yields whatever arrived since the previous block, or b"" when nothing
+    arrived within _PROGRESS_POLL_SECONDS. Stops at end of file.
+    """
+    fd = stream.fileno()
+    
+    if sys.platform == "win32":
+        # select() only supports sockets on Windows: read on a helper thread
+        chunks: "queue.Queue[bytes]" = queue.Queue()
+        
+        def pump():
+            try:
+                while True:
+                    chunk = os.read(fd, _PROGRESS_READ_SIZE)
+                    if not chunk:
+                        break
+                    chunks.put(chunk)
+            finally:
+                # Always signal the end, even if the read fails
+                chunks.put(b"")
+        
+        threading.Thread(target=pump, daemon=True).start()
+        
+        while True:
+            try:
+                chunk = chunks.get(timeout=_PROGRESS_POLL_SECONDS)
+            except queue.Empty:
+                yield b""
+                continue
+            if not chunk:
+                return
+            yield chunk
+    
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            if not selector.select(timeout=_PROGRESS_POLL_SECONDS):
+                yield b""
+                continue
+            chunk = os.read(fd, _PROGRESS_READ_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
 def convert_audio_to_video(
     audio_path: Path,
     cover_image_path: Path,
     output_path: Path,
     progress_callback: Optional[Callable[[float], None]] = None,
     cancel_check: Optional[Callable[[], bool]] = None,
-    resolution: Tuple[int, int] = (1280, 720),
+    resolution: Tuple[int, int] = DEFAULT_RESOLUTION,
     fps: int = 30,
     video_bitrate: str = "4000k",
-    audio_bitrate: str = "192k"
+    audio_bitrate: str = "192k",
+    video_encoder: str = SOFTWARE_VIDEO_ENCODER,
+    fast_still: bool = True
 ) -> ConversionResult:
     """
     Converts an audio file to an MPEG video using a cover image.
@@ -113,55 +470,90 @@ def convert_audio_to_video(
         audio_path: Path to the audio file
         cover_image_path: Path to the cover image
         output_path: Path for the output .mpg file
-        progress_callback: Optional callback for progress updates (0.0 to 1.0)
+        progress_callback: Optional callback for progress updates (0.0 to 1.0).
+            Called on the calling thread at most once per ffmpeg progress
+            report, and only when the value changes; it should not block.
         cancel_check: Optional callback that returns True if conversion should be cancelled
         resolution: Output video resolution (width, height)
         fps: Frames per second
         video_bitrate: Video bitrate (e.g., "4000k")
         audio_bitrate: Audio bitrate (e.g., "192k")
+        video_encoder: FFmpeg MPEG-2 encoder (see select_video_encoder)
+        fast_still: Loop a pre-encoded segment of the cover (see
+            prepare_still_segment) instead of encoding every frame.
+            Falls back to the full encode if the segment cannot be created.
     
     Returns:
         ConversionResult with success status and output path or error message
     """
     ffmpeg_path = get_ffmpeg_path()
     
-    if not ffmpeg_path.exists():
+    # One stat per input; the cover's is reused for the still segment
+    if _stat_or_none(ffmpeg_path) is None:
         return ConversionResult(
             success=False,
             error_message=f"FFmpeg não encontrado em: {ffmpeg_path}"
         )
     
-    if not audio_path.exists():
+    if _stat_or_none(audio_path) is None:
         return ConversionResult(
             success=False,
             error_message=f"Arquivo de áudio não encontrado: {audio_path}"
         )
     
-    if not cover_image_path.exists():
+    cover_stat = _stat_or_none(cover_image_path)
+    if cover_stat is None:
         return ConversionResult(
             success=False,
             error_message=f"Imagem de capa não encontrada: {cover_image_path}"
         )
     
-    # Get audio duration for progress calculation
-    duration = get_audio_duration(audio_path)
-    duration_ms = duration * 1000 if duration else None
+    segment_path = None
+    if fast_still:
+        segment_path = prepare_still_segment(
+            cover_image_path, resolution, fps, video_bitrate, video_encoder, cover_stat=cover_stat
+        )
     
     # Build FFmpeg command
-    width, height = resolution
-    cmd = [
-        safe_path_string(ffmpeg_path),
-        "-y",  # Overwrite output file
-        "-loop", "1",  # Loop the image
-        "-i", safe_path_string(cover_image_path),
-        "-i", safe_path_string(audio_path),
-        "-c:v", "mpeg2video",
-        "-c:a", "mp2",
-        "-b:v", video_bitrate,
-        "-b:a", audio_bitrate,
-        "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,format=yuv420p",
-        "-r", str(fps),
-        "-shortest",  # End when audio ends
+    if segment_path:
+        cmd = [
+            safe_path_string(ffmpeg_path),
+            "-y",  # Overwrite output file
+            "-stream_loop", "-1",  # Repeat the still segment until the audio ends
+            "-i", safe_path_string(segment_path),
+            "-i", safe_path_string(audio_path),
+            "-map", "0:v",
+            "-map", "1:a:0",  # One audio track, even for multi-track containers
+            "-c:v", "copy",
+            "-c:a", "mp2",
+            "-b:a", audio_bitrate,
+            "-shortest",  # End when audio ends
+        ]
+    else:
+        cmd = [
+            safe_path_string(ffmpeg_path),
+            "-y",  # Overwrite output file
+            "-filter_threads", "0",  # Scale/pad on all cores
+            "-loop", "1",  # Loop the image
+            "-framerate", "1",  # One input frame per second; -r duplicates it after filtering
+            "-i", safe_path_string(cover_image_path),
+            "-i", safe_path_string(audio_path),
+            "-c:v", video_encoder,
+            "-threads", "0",  # Let the encoder use all cores (slice threads)
+            "-c:a", "mp2",
+            "-b:v", video_bitrate,
+            "-b:a", audio_bitrate,
+            # The picture never changes: use long GOPs so almost every frame is a
+            # near-empty P/B-frame instead of a full I-frame
+            "-g", str(fps * STILL_IMAGE_GOP_SECONDS),
+            "-vf", get_letterbox_filter(resolution, HARDWARE_VIDEO_ENCODERS.get(video_encoder, "yuv420p")),
+            "-r", str(fps),
+            "-shortest",  # End when audio ends
+        ]
+    
+    # ffmpeg reports progress every 0.5 s by default, which is plenty:
+    # the UI polls the latest value on its own timer
+    cmd += [
         "-progress", "pipe:1",
         "-nostats",
         safe_path_string(output_path)
@@ -169,22 +561,33 @@ def convert_audio_to_video(
     
     try:
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        parent_key = os.fspath(output_path.parent)
+        if parent_key not in _created_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(parent_key)
         
         # Start FFmpeg process
-        creationflags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+        # Binary pipes: the progress and stderr parsers work on raw bytes
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            creationflags=creationflags
+            bufsize=65536,
+            creationflags=_CREATION_FLAGS
         )
         
-        # Parse progress from stdout
-        current_time_ms = 0
+        # Drain stderr concurrently; it also reports the audio duration
+        # (input #1) used for progress, instead of running ffprobe first
+        stderr_reader = _StderrReader(process.stderr, input_index=1)
+        stderr_reader.start()
         
-        while True:
+        # Parse progress from stdout. ffmpeg writes a block of key=value lines
+        # per update; only the most recent position in each read matters.
+        pending = b""
+        inv_duration_us = None
+        last_progress = None
+        
+        for chunk in _read_progress_chunks(process.stdout):
             # Check for cancellation
             if cancel_check and cancel_check():
                 process.terminate()
@@ -205,47 +608,40 @@ def convert_audio_to_video(
                     error_message="Conversão cancelada pelo usuário"
                 )
             
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
+            if not chunk:
+                continue
+            
+            data, _, pending = (pending + chunk).rpartition(b"\n")
+            progress = None
             
-            line = line.strip()
-            if "=" in line:
-                key, value = line.split("=", 1)
+            if data.rstrip().endswith(b"progress=end"):
+                progress = 1.0
+            else:
+                if inv_duration_us is None and stderr_reader.duration:
+                    inv_duration_us = 1.0 / (stderr_reader.duration * 1_000_000)
                 
-                if key == "out_time_us" and duration_ms:
-                    # out_time_us is in microseconds
+                value_start = data.rfind(b"out_time_us=")
+                if value_start != -1 and inv_duration_us:
+                    value_start += len(b"out_time_us=")
+                    value_end = data.find(b"\n", value_start)
+                    if value_end == -1:
+                        value_end = len(data)
                     try:
-                        current_time_us = int(value)
-                        current_time_ms = current_time_us / 1000
-                        progress = min(current_time_ms / duration_ms, 1.0)
-                        if progress_callback:
-                            progress_callback(progress)
+                        progress = min(int(data[value_start:value_end]) * inv_duration_us, 1.0)
                     except ValueError:
-                        pass
-                elif key == "out_time" and duration_ms:
-                    # out_time is in HH:MM:SS.microseconds format
-                    try:
-                        time_parts = value.split(":")
-                        if len(time_parts) == 3:
-                            hours = int(time_parts[0])
-                            minutes = int(time_parts[1])
-                            seconds = float(time_parts[2])
-                            current_time_ms = (hours * 3600 + minutes * 60 + seconds) * 1000
-                            progress = min(current_time_ms / duration_ms, 1.0)
-                            if progress_callback:
-                                progress_callback(progress)
-                    except (ValueError, IndexError):
-                        pass
-                elif key == "progress" and value == "end":
-                    if progress_callback:
-                        progress_callback(1.0)
+                        pass  # "N/A" before the first frame is written
+            
+            if progress is not None and progress != last_progress:
+                last_progress = progress
+                if progress_callback:
+                    progress_callback(progress)
         
         # Get the return code
         return_code = process.wait()
         
-        # Read any remaining stderr
-        stderr_output = process.stderr.read()
+        # Collect the remaining stderr
+        stderr_reader.join(timeout=5)
+        stderr_output = stderr_reader.output
         
         if return_code != 0:
             return ConversionResult(
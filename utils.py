@@ -3,11 +3,28 @@ Utility functions for the audio-to-video converter.
 Handles path resolution, output naming, and desktop path detection.
 """
 
+import os
 import sys
+import shutil
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 
+# Supported audio extensions (lowercase, with dot)
+_AUDIO_EXTENSIONS = frozenset({
+    '.m4a', '.mp3', '.wav', '.aac', '.flac', '.ogg',
+    '.wma', '.opus', '.aiff', '.aif', '.mp2', '.mp4',
+    '.webm', '.mkv', '.avi'  # Some video formats that contain audio
+})
+
+# Supported cover image extensions (lowercase, with dot)
+_IMAGE_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp', '.tiff', '.tif'
+})
+
+
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     """
     Returns the application directory.
@@ -21,14 +38,14 @@ def get_app_dir() -> Path:
         return Path(__file__).parent.resolve()
 
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_path() -> Path:
     """
     Returns the path to ffmpeg executable.
     Uses .exe on Windows, no extension on Mac/Linux.
     Falls back to system ffmpeg if bundled version not found.
+    The lookup is done once per process (see invalidate_paths).
     """
-    import shutil
-    
     if sys.platform == "win32":
         bundled = get_app_dir() / "bin" / "ffmpeg.exe"
     else:
@@ -46,14 +63,14 @@ def get_ffmpeg_path() -> Path:
     return bundled
 
 
+@functools.lru_cache(maxsize=1)
 def get_ffprobe_path() -> Path:
     """
     Returns the path to ffprobe executable.
     Uses .exe on Windows, no extension on Mac/Linux.
     Falls back to system ffprobe if bundled version not found.
+    The lookup is done once per process (see invalidate_paths).
     """
-    import shutil
-    
     if sys.platform == "win32":
         bundled = get_app_dir() / "bin" / "ffprobe.exe"
     else:
@@ -71,13 +88,42 @@ def get_ffprobe_path() -> Path:
     return bundled
 
 
+def invalidate_paths():
+    """
+    Clears the cached application, ffmpeg, ffprobe, Desktop and cache paths,
+    so they are looked up again on the next call.
+    """
+    get_app_dir.cache_clear()
+    get_ffmpeg_path.cache_clear()
+    get_ffprobe_path.cache_clear()
+    get_desktop_path.cache_clear()
+    get_cache_dir.cache_clear()
+
+
+def get_letterbox_filter(resolution: Tuple[int, int], pixel_format: str = "yuv420p") -> str:
+    """
+    Returns the ffmpeg filter chain that fits an image into the given
+    resolution, keeping its aspect ratio and padding the borders (letterbox).
+    
+    Args:
+        resolution: Target (width, height)
+        pixel_format: Output pixel format (e.g. "yuv420p" for video, "rgb24" for PNG)
+    """
+    width, height = resolution
+    return (
+        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,"
+        f"format={pixel_format}"
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def get_desktop_path() -> Path:
     """
     Returns the user's Desktop path.
     Works on Windows, macOS, and Linux.
     """
     if sys.platform == "win32":
-        import os
         desktop = Path(os.environ.get("USERPROFILE", "")) / "Desktop"
         if desktop.exists():
             return desktop
@@ -98,6 +144,29 @@ def get_default_output_folder() -> Path:
     return get_desktop_path() / "Audio2Video_Exports"
 
 
+@functools.lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """
+    Returns the cache directory, creating it if necessary.
+    Used for intermediate files that can be regenerated (the still-image
+    video segments looped during conversion).
+    The directory is resolved and created once per process (see invalidate_paths).
+    """
+    if sys.platform == "win32":
+        local_app_data = Path(os.environ.get("LOCALAPPDATA", ""))
+        if local_app_data.exists():
+            cache_dir = local_app_data / "Audio2Video" / "cache"
+        else:
+            cache_dir = get_app_dir() / "cache"
+    elif sys.platform == "darwin":
+        cache_dir = Path.home() / "Library" / "Caches" / "Audio2Video"
+    else:
+        cache_dir = Path.home() / ".cache" / "audio2video"
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def ensure_output_folder(folder: Path) -> Path:
     """
     Ensures the output folder exists, creating it if necessary.
@@ -107,7 +176,24 @@ def ensure_output_folder(folder: Path) -> Path:
     return folder
 
 
-def get_unique_output_path(output_folder: Path, base_name: str, extension: str = ".mpg") -> Path:
+def list_output_names(output_folder: Path) -> Optional[Set[str]]:
+    """
+    Lists the names in a folder, casefolded, for get_unique_output_path.
+    Returns None if the folder cannot be read (e.g. it does not exist yet).
+    """
+    try:
+        with os.scandir(output_folder) as entries:
+            return {entry.name.casefold() for entry in entries}
+    except OSError:
+        return None
+
+
+def get_unique_output_path(
+    output_folder: Path,
+    base_name: str,
+    extension: str = ".mpg",
+    existing: Optional[Set[str]] = None
+) -> Path:
     """
     Generates a unique output file path.
     If file exists, appends (1), (2), etc.
@@ -116,6 +202,11 @@ def get_unique_output_path(output_folder: Path, base_name: str, extension: str =
         output_folder: The folder to save the file in
         base_name: The base name of the file (without extension)
         extension: The file extension (default: .mpg)
+        existing: Optional result of list_output_names(output_folder).
+            Names are checked against it instead of the disk, and the
+            returned name is added to it, so a batch can list the folder
+            once and resolve its items one after another without
+            handing out the same name twice.
     
     Returns:
         A unique file path that doesn't exist yet
@@ -125,40 +216,92 @@ def get_unique_output_path(output_folder: Path, base_name: str, extension: str =
     if not extension.startswith("."):
         extension = f".{extension}"
     
+    # Candidates are plain file names; a Path is only built for the result
+    folder = os.fspath(output_folder)
+    
+    def candidate(counter: int) -> str:
+        if counter == 0:
+            return f"{base_name}{extension}"
+        return f"{base_name} ({counter}){extension}"
+    
+    def is_taken(name: str) -> bool:
+        # Names are compared casefolded, as Windows and macOS folders usually are
+        if existing is not None:
+            return name.casefold() in existing
+        return os.path.exists(os.path.join(folder, name))
+    
     # Try the base name first
-    output_path = output_folder / f"{base_name}{extension}"
-    if not output_path.exists():
-        return output_path
+    name = candidate(0)
     
-    # If exists, try with counter
-    counter = 1
-    while True:
-        output_path = output_folder / f"{base_name} ({counter}){extension}"
-        if not output_path.exists():
-            return output_path
-        counter += 1
+    if is_taken(name):
+        # Numbered copies are normally 1..N without gaps: double the
+        # counter until a free name is found, then binary search back
+        # for the first free one (O(log N) checks instead of O(N))
+        high = 1
+        while is_taken(candidate(high)):
+            high *= 2
+        
+        low = high // 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if is_taken(candidate(middle)):
+                low = middle
+            else:
+                high = middle
+        
+        name = candidate(high)
+    
+    if existing is not None:
+        existing.add(name.casefold())
+    return output_folder / name
 
 
 def is_supported_audio_file(file_path: Path) -> bool:
     """
     Checks if the file is a supported audio format.
     """
-    supported_extensions = {
-        '.m4a', '.mp3', '.wav', '.aac', '.flac', '.ogg',
-        '.wma', '.opus', '.aiff', '.aif', '.mp2', '.mp4',
-        '.webm', '.mkv', '.avi'  # Some video formats that contain audio
-    }
-    return file_path.suffix.lower() in supported_extensions
+    return file_path.suffix.lower() in _AUDIO_EXTENSIONS
+
+
+def filter_audio_paths(paths: Iterable[Path]) -> List[Path]:
+    """
+    Returns the paths that are supported audio files, in the same order.
+    """
+    return [path for path in paths if path.suffix.lower() in _AUDIO_EXTENSIONS]
+
+
+def iter_audio_files(folder: Path) -> Iterator[Path]:
+    """
+    Yields the supported audio files in a folder and its subfolders.
+    Uses os.scandir so entries are filtered by name before a Path is built,
+    and directory entries come with their type (no extra stat per file).
+    Symlinked folders are not followed.
+    """
+    pending = [os.fspath(folder)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif (
+                            os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS
+                            and entry.is_file()
+                        ):
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 def is_supported_image_file(file_path: Path) -> bool:
     """
     Checks if the file is a supported image format.
     """
-    supported_extensions = {
-        '.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp', '.tiff', '.tif'
-    }
-    return file_path.suffix.lower() in supported_extensions
+    return file_path.suffix.lower() in _IMAGE_EXTENSIONS
 
 
 def format_duration(seconds: float) -> str:
@@ -178,5 +321,9 @@ def format_duration(seconds: float) -> str:
 def safe_path_string(path: Path) -> str:
     """
     Returns a safely encoded path string for subprocess calls.
+    Absolute paths are used as they are; only relative ones are resolved
+    (resolve() walks and stats every component of the path).
     """
+    if path.is_absolute():
+        return os.fspath(path)
     return str(path.resolve())